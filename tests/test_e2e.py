@@ -5,6 +5,7 @@ These tests verify the complete integration between PyInfra and OrbStack,
 including VM lifecycle management, command execution, and file operations.
 """
 
+import functools
 import json
 import os
 import platform
@@ -16,6 +17,7 @@ from unittest.mock import Mock
 import pytest
 
 from pyinfra_orbstack.connector import OrbStackConnector
+from tests.test_utils import delete_vm_with_retry, wait_for_vm_state
 
 
 def check_orbstack_available():
@@ -54,6 +56,268 @@ if not orbstack_available:
     pytest.skip(f"OrbStack not available: {orbstack_reason}", allow_module_level=True)
 
 
+ORBCTL = "orbctl"
+TEST_IMAGE = "ubuntu:22.04"
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_orbctl_json(payload):
+    """Parse orbctl JSON output, reusing the result for identical payloads."""
+    return json.loads(payload)
+
+
+class OrbctlCache:
+    """Parsed orbctl JSON output keyed on argv, dropped on VM state changes."""
+
+    def __init__(self):
+        self._cache = {}
+
+    def json(self, args, invalidate=False):
+        """Run a read-only orbctl command and return its parsed JSON output.
+
+        Output is cached per argv until the next VM state change, so repeated
+        assertions against the same VM state don't re-spawn orbctl.
+        """
+        key = tuple(args)
+        if invalidate or key not in self._cache:
+            # check_output returns stdout bytes (json.loads parses them without
+            # a decode) and doesn't buffer stderr
+            try:
+                stdout = subprocess.check_output(
+                    args, stderr=subprocess.DEVNULL, timeout=10
+                )
+            except subprocess.CalledProcessError as e:
+                pytest.fail(f"{' '.join(args)} failed with exit code {e.returncode}")
+            self._cache[key] = _parse_orbctl_json(stdout)
+        return self._cache[key]
+
+    def invalidate(self):
+        """Drop cached orbctl output after a VM state transition."""
+        self._cache.clear()
+
+    def wait_state(self, name, target, timeout=15):
+        """Poll ``orbctl info`` with backoff until the VM reaches ``target``.
+
+        The last successful payload is left in the cache so the assertions
+        that follow the wait don't spawn another ``orbctl info``.
+
+        Returns:
+            True if the state was reached before the timeout, False otherwise
+        """
+        key = (ORBCTL, "info", name, "--format", "json")
+
+        def remember(info):
+            self._cache[key] = info
+
+        return wait_for_vm_state(name, target, timeout=timeout, on_info=remember)
+
+
+@pytest.fixture(scope="module")
+def vm_name_base():
+    """Timestamped VM name prefix, computed once for the whole module."""
+    return f"e2e-test-vm-{int(time.time())}"
+
+
+@pytest.fixture
+def vm_name(vm_name_base, request):
+    """Deterministic per-test VM name derived from the module prefix.
+
+    Using the test function's name keeps names unique across tests (and
+    across xdist workers) without another timestamp per test.
+    """
+    test_name = request.node.originalname.removeprefix("test_")
+    return f"{vm_name_base}-{test_name.replace('_', '-')}"
+
+
+@pytest.fixture
+def create_vm():
+    """Create VMs for a test and delete the ones actually created afterwards.
+
+    Usage in tests:
+        def test_something(create_vm):
+            result = create_vm("my-test-vm", "--arch", "arm64")
+
+    A test that deletes a VM itself calls ``create_vm.forget(name)`` so the
+    teardown doesn't spawn another delete for it.
+    """
+    created = []
+
+    def _create(name, *extra_args):
+        result = subprocess.run(
+            (ORBCTL, "create", TEST_IMAGE, name, *extra_args),
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        if result.returncode == 0:
+            created.append(name)
+        return result
+
+    def _forget(name):
+        created.remove(name)
+
+    _create.forget = _forget
+    yield _create
+
+    # Nothing was created (e.g. the create failed): no orbctl call at all
+    if not created:
+        return
+    try:
+        # Names came from successful creates, so skip listing and force delete
+        # them all with a single orbctl call
+        subprocess.run(
+            (ORBCTL, "delete", "-f", *created), capture_output=True, timeout=30
+        )
+    except Exception:
+        pass  # Best effort cleanup
+
+
+@pytest.fixture
+def orbctl():
+    """Per-test cache of parsed orbctl JSON output."""
+    return OrbctlCache()
+
+
+def test_vm_lifecycle_end_to_end(vm_name, create_vm, orbctl):
+    """Test complete VM lifecycle using direct orbctl commands.
+
+    NOTE: This test has been consolidated into test_vm_lifecycle_consolidated.py
+    to reduce redundancy. This test is kept for backward compatibility but
+    the consolidated version provides more comprehensive coverage.
+    """
+    # Test VM creation
+    create_result = create_vm(vm_name)
+    assert create_result.returncode == 0, f"VM creation failed: {create_result.stderr}"
+    orbctl.invalidate()
+
+    # Wait for VM to be ready
+    assert orbctl.wait_state(vm_name, "running"), "VM did not start"
+
+    # Test VM listing
+    vms = orbctl.json((ORBCTL, "list", "-f", "json"))
+    vm_names = [vm.get("name") for vm in vms]
+    assert vm_name in vm_names, "Created VM should be in list"
+
+    # Test VM start
+    start_result = subprocess.run(
+        (ORBCTL, "start", vm_name),
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+    assert start_result.returncode == 0, f"VM start failed: {start_result.stderr}"
+    orbctl.invalidate()
+
+    # Wait for VM to start
+    assert orbctl.wait_state(vm_name, "running"), "VM did not start"
+
+    # Test VM info
+    vm_info = orbctl.json((ORBCTL, "info", vm_name, "--format", "json"))
+    assert isinstance(vm_info, dict), "VM info should be a dictionary"
+
+    # Test VM stop
+    stop_result = subprocess.run(
+        (ORBCTL, "stop", vm_name),
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+    assert stop_result.returncode == 0, f"VM stop failed: {stop_result.stderr}"
+    orbctl.invalidate()
+
+    # Wait for VM to stop
+    assert orbctl.wait_state(vm_name, "stopped"), "VM did not stop"
+
+    # Test VM deletion
+    delete_result = subprocess.run(
+        (ORBCTL, "delete", "-f", vm_name),
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+    assert delete_result.returncode == 0, f"VM deletion failed: {delete_result.stderr}"
+    create_vm.forget(vm_name)
+
+    # Verify VM is deleted: orbctl info exits non-zero for a missing VM, which
+    # avoids listing and parsing every VM just to check one name
+    gone = subprocess.run(
+        (ORBCTL, "info", vm_name, "--format", "json"),
+        capture_output=True,
+        timeout=10,
+    )
+    assert gone.returncode != 0, "VM should be deleted"
+
+
+@pytest.mark.parametrize(
+    "suffix,extra_args",
+    [("arm64", ["--arch", "arm64"]), ("user", ["--user", "ubuntu"])],
+    ids=["arch", "user"],
+)
+def test_vm_operations_with_parameters(vm_name, create_vm, suffix, extra_args):
+    """Test VM creation with an architecture or user specification."""
+    # Note: arm64 might fail if it is not supported on the current system
+    # We'll just verify the operation structure is correct; a VM that was
+    # created is deleted by the create_vm fixture
+    create_vm(f"{vm_name}-{suffix}", *extra_args)
+
+
+def test_vm_lifecycle_operations(vm_name, create_vm, orbctl):
+    """Test VM lifecycle operations (start, stop, restart)."""
+    # Create a test VM
+    create_result = create_vm(vm_name)
+    assert create_result.returncode == 0, f"VM creation failed: {create_result.stderr}"
+
+    # Wait for VM to be ready
+    assert orbctl.wait_state(vm_name, "running"), "VM did not start"
+
+    # Test VM start
+    start_result = subprocess.run(
+        (ORBCTL, "start", vm_name),
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+    assert start_result.returncode == 0, f"VM start failed: {start_result.stderr}"
+
+    # Wait for VM to start
+    assert orbctl.wait_state(vm_name, "running"), "VM did not start"
+
+    # Test VM restart
+    restart_result = subprocess.run(
+        (ORBCTL, "restart", vm_name),
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+    assert restart_result.returncode == 0, f"VM restart failed: {restart_result.stderr}"
+
+    # Wait for VM to restart
+    assert orbctl.wait_state(vm_name, "running"), "VM did not restart"
+
+    # Test VM stop
+    stop_result = subprocess.run(
+        (ORBCTL, "stop", vm_name),
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+    assert stop_result.returncode == 0, f"VM stop failed: {stop_result.stderr}"
+
+    # Wait for VM to stop
+    assert orbctl.wait_state(vm_name, "stopped"), "VM did not stop"
+
+    # Test force stop
+    force_stop_result = subprocess.run(
+        (ORBCTL, "stop", "-f", vm_name),
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+    assert (
+        force_stop_result.returncode == 0
+    ), f"Force stop failed: {force_stop_result.stderr}"
+
+
 class TestEndToEndIntegration:
     """End-to-end integration tests for PyInfra OrbStack."""
 
@@ -61,7 +325,7 @@ class TestEndToEndIntegration:
         """Set up test fixtures."""
         # Create a unique test VM name
         self.test_vm_name = f"e2e-test-vm-{int(time.time())}"
-        self.test_image = "ubuntu:22.04"
+        self.test_image = TEST_IMAGE
 
         # Create temporary files for testing
         self.temp_dir = tempfile.mkdtemp()
@@ -87,118 +351,13 @@ class TestEndToEndIntegration:
             shutil.rmtree(self.temp_dir)
 
     def _cleanup_test_vm(self):
-        """Clean up test VM if it exists."""
+        """Clean up the test VM if it exists."""
         try:
-            # Check if VM exists
-            result = subprocess.run(
-                ["orbctl", "list", "-f", "json"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-
-            if result.returncode == 0:
-                vms = json.loads(result.stdout)
-                _vm_exists = any(
-                    vm_data.get("name") == self.test_vm_name for vm_data in vms
-                )
-
-                if _vm_exists:
-                    # Force delete the VM
-                    subprocess.run(
-                        ["orbctl", "delete", "-f", self.test_vm_name],
-                        capture_output=True,
-                        timeout=30,
-                    )
+            delete_vm_with_retry(self.test_vm_name)
         except Exception:
             # Ignore cleanup errors
             pass
 
-    def test_vm_lifecycle_end_to_end(self):
-        """Test complete VM lifecycle using direct orbctl commands.
-
-        NOTE: This test has been consolidated into test_vm_lifecycle_consolidated.py
-        to reduce redundancy. This test is kept for backward compatibility but
-        the consolidated version provides more comprehensive coverage.
-        """
-        # Test VM creation
-        create_result = subprocess.run(
-            ["orbctl", "create", self.test_image, self.test_vm_name],
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
-        assert (
-            create_result.returncode == 0
-        ), f"VM creation failed: {create_result.stderr}"
-
-        # Wait for VM to be ready
-        time.sleep(5)
-
-        # Test VM listing
-        list_result = subprocess.run(
-            ["orbctl", "list", "-f", "json"], capture_output=True, text=True, timeout=10
-        )
-        assert list_result.returncode == 0
-        vms = json.loads(list_result.stdout)
-        vm_names = [vm.get("name") for vm in vms]
-        assert self.test_vm_name in vm_names, "Created VM should be in list"
-
-        # Test VM start
-        start_result = subprocess.run(
-            ["orbctl", "start", self.test_vm_name],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        assert start_result.returncode == 0, f"VM start failed: {start_result.stderr}"
-
-        # Wait for VM to start
-        time.sleep(10)
-
-        # Test VM info
-        info_result = subprocess.run(
-            ["orbctl", "info", self.test_vm_name, "--format", "json"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        assert info_result.returncode == 0, f"VM info failed: {info_result.stderr}"
-        vm_info = json.loads(info_result.stdout)
-        assert isinstance(vm_info, dict), "VM info should be a dictionary"
-
-        # Test VM stop
-        stop_result = subprocess.run(
-            ["orbctl", "stop", self.test_vm_name],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        assert stop_result.returncode == 0, f"VM stop failed: {stop_result.stderr}"
-
-        # Wait for VM to stop
-        time.sleep(5)
-
-        # Test VM deletion
-        delete_result = subprocess.run(
-            ["orbctl", "delete", "-f", self.test_vm_name],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        assert (
-            delete_result.returncode == 0
-        ), f"VM deletion failed: {delete_result.stderr}"
-
-        # Verify VM is deleted
-        list_result = subprocess.run(
-            ["orbctl", "list", "-f", "json"], capture_output=True, text=True, timeout=10
-        )
-        assert list_result.returncode == 0
-        vms = json.loads(list_result.stdout)
-        vm_names = [vm.get("name") for vm in vms]
-        assert self.test_vm_name not in vm_names, "VM should be deleted"
-
     def test_connector_command_execution(self):
         """Test command execution through the OrbStack connector."""
         # Create a test VM
@@ -311,114 +470,6 @@ class TestEndToEndIntegration:
             timeout=30,
         )
 
-    def test_vm_operations_with_parameters(self):
-        """Test VM operations with various parameters."""
-        # Test VM creation with architecture specification
-        arm64_vm_name = f"{self.test_vm_name}-arm64"
-        create_result = subprocess.run(
-            ["orbctl", "create", self.test_image, arm64_vm_name, "--arch", "arm64"],
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
-
-        # Note: This might fail if arm64 is not supported on the current system
-        # We'll just verify the operation structure is correct
-        if create_result.returncode == 0:
-            subprocess.run(
-                ["orbctl", "delete", "-f", arm64_vm_name],
-                capture_output=True,
-                timeout=30,
-            )
-
-        # Test VM creation with user specification
-        user_vm_name = f"{self.test_vm_name}-user"
-        create_result = subprocess.run(
-            ["orbctl", "create", self.test_image, user_vm_name, "--user", "ubuntu"],
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
-
-        if create_result.returncode == 0:
-            subprocess.run(
-                ["orbctl", "delete", "-f", user_vm_name],
-                capture_output=True,
-                timeout=30,
-            )
-
-    def test_vm_lifecycle_operations(self):
-        """Test VM lifecycle operations (start, stop, restart)."""
-        # Create a test VM
-        create_result = subprocess.run(
-            ["orbctl", "create", self.test_image, self.test_vm_name],
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
-        assert (
-            create_result.returncode == 0
-        ), f"VM creation failed: {create_result.stderr}"
-
-        # Wait for VM to be ready
-        time.sleep(5)
-
-        # Test VM start
-        start_result = subprocess.run(
-            ["orbctl", "start", self.test_vm_name],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        assert start_result.returncode == 0, f"VM start failed: {start_result.stderr}"
-
-        # Wait for VM to start
-        time.sleep(10)
-
-        # Test VM restart
-        restart_result = subprocess.run(
-            ["orbctl", "restart", self.test_vm_name],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        assert (
-            restart_result.returncode == 0
-        ), f"VM restart failed: {restart_result.stderr}"
-
-        # Wait for VM to restart
-        time.sleep(10)
-
-        # Test VM stop
-        stop_result = subprocess.run(
-            ["orbctl", "stop", self.test_vm_name],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        assert stop_result.returncode == 0, f"VM stop failed: {stop_result.stderr}"
-
-        # Wait for VM to stop
-        time.sleep(5)
-
-        # Test force stop
-        force_stop_result = subprocess.run(
-            ["orbctl", "stop", "-f", self.test_vm_name],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
-        assert (
-            force_stop_result.returncode == 0
-        ), f"Force stop failed: {force_stop_result.stderr}"
-
-        # Clean up
-        subprocess.run(
-            ["orbctl", "delete", "-f", self.test_vm_name],
-            capture_output=True,
-            timeout=30,
-        )
-
     def test_connector_make_names_data(self):
         """Test the connector's make_names_data method."""
         # Get VMs using the connector's make_names_data method
@@ -666,5 +717,10 @@ class TestEndToEndIntegration:
         assert hasattr(vm, "vm_network_info")
 
 
-# Mark all tests as integration tests
-pytestmark = pytest.mark.integration
+# Mark all tests as integration and end-to-end tests, kept on a single
+# xdist worker so real-VM operations never run concurrently
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.e2e,
+    pytest.mark.xdist_group(name="orbctl_serial"),
+]
@@ -10,6 +10,7 @@ import subprocess
 from unittest.mock import Mock, patch
 
 from pyinfra_orbstack.connector import OrbStackConnector
+from tests.test_utils import wait_for_vm_state
 
 
 class TestOrbStackCLIMocks:
@@ -654,3 +655,40 @@ class TestOrbStackCLIEdgeCases:
             "-c",
             "ls 'path with spaces'",
         ]
+
+
+class TestWaitForVMState:
+    """Test the backoff poller used by the VM lifecycle tests."""
+
+    @patch("time.sleep")
+    @patch("subprocess.run")
+    def test_keeps_polling_through_timeout_and_bad_json(self, mock_run, mock_sleep):
+        """Test that orbctl timeouts and undecodable output are retried."""
+        mock_run.side_effect = [
+            subprocess.TimeoutExpired(cmd="orbctl info", timeout=5),
+            Mock(returncode=0, stdout=b"not json"),
+            Mock(returncode=0, stdout=b'{"record": {"state": "running"}}'),
+        ]
+
+        assert wait_for_vm_state("test-vm", "running") is True
+        assert mock_run.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    @patch("time.sleep")
+    @patch("subprocess.run")
+    def test_reports_payloads_to_callback(self, mock_run, mock_sleep):
+        """Test that each decoded payload is passed to on_info."""
+        mock_run.side_effect = [
+            Mock(returncode=0, stdout=b'{"record": {"state": "starting"}}'),
+            Mock(returncode=0, stdout=b'{"record": {"state": "running"}}'),
+        ]
+        seen = []
+
+        assert wait_for_vm_state("test-vm", "running", on_info=seen.append) is True
+        assert [info["record"]["state"] for info in seen] == ["starting", "running"]
+
+    @patch("subprocess.run")
+    def test_times_out(self, mock_run):
+        """Test that False is returned once the deadline has passed."""
+        assert wait_for_vm_state("test-vm", "running", timeout=0) is False
+        mock_run.assert_not_called()
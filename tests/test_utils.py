@@ -2,11 +2,19 @@
 Test utilities for resilient VM operations.
 """
 
+import functools
 import os
 import subprocess
 import time
 import uuid
-from typing import Optional
+from json import JSONDecodeError
+from json import loads as _json_loads
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
 
 # Import cleanup tracking from conftest
 try:
@@ -16,6 +24,48 @@ except ImportError:
     _test_vms_created = set()
 
 
+def loads_json(payload: Any) -> Any:
+    """
+    Decode orbctl JSON output, using orjson when it is installed.
+
+    Accepts str or bytes. orjson.JSONDecodeError subclasses
+    json.JSONDecodeError, so callers catch the same exception either way.
+    """
+    if orjson is not None:
+        return orjson.loads(payload)
+    return _json_loads(payload)
+
+
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=32)
+def _split_path(path: str) -> tuple[str, ...]:
+    return tuple(path.split("."))
+
+
+def get_nested(data: Any, path: str, default: Any = None) -> Any:
+    """
+    Look up a dotted path such as "record.state" in decoded orbctl JSON.
+
+    Args:
+        data: Decoded JSON object
+        path: Dot-separated keys to follow
+        default: Value returned when any key along the path is missing
+
+    Returns:
+        The value at the path, or default
+    """
+    current = data
+    for key in _split_path(path):
+        if not isinstance(current, dict):
+            return default
+        current = current.get(key, _MISSING)
+        if current is _MISSING:
+            return default
+    return current
+
+
 def check_orbstack_healthy() -> tuple[bool, str]:
     """
     Check if OrbStack is healthy and responsive.
@@ -78,8 +128,6 @@ def wait_for_vm_ready(
         if not wait_for_vm_ready(vm_name, timeout=30):
             raise RuntimeError(f"VM {vm_name} did not become ready")
     """
-    import json
-
     start_time = time.time()
 
     while (time.time() - start_time) < timeout:
@@ -92,9 +140,8 @@ def wait_for_vm_ready(
             )
 
             if result.returncode == 0:
-                info = json.loads(result.stdout)
-                record = info.get("record", {})
-                state = record.get("state")
+                info = loads_json(result.stdout)
+                state = get_nested(info, "record.state")
                 ip4 = info.get("ip4")
 
                 # VM is ready when it's running and has an IP
@@ -105,7 +152,7 @@ def wait_for_vm_ready(
                     )
                     return True
 
-        except (subprocess.TimeoutExpired, json.JSONDecodeError, KeyError):
+        except (subprocess.TimeoutExpired, JSONDecodeError, KeyError):
             pass
 
         time.sleep(poll_interval)
@@ -116,6 +163,57 @@ def wait_for_vm_ready(
     return False
 
 
+def wait_for_vm_state(
+    vm_name: str,
+    want: str,
+    timeout: float = 30,
+    initial_delay: float = 0.2,
+    max_delay: float = 1.5,
+    on_info: Optional[Callable[[Any], None]] = None,
+) -> bool:
+    """
+    Wait for a VM to reach the given state, polling with exponential backoff.
+
+    Unlike a fixed time.sleep(), this returns as soon as the VM gets there,
+    while the growing delay keeps slow transitions from hammering orbctl.
+
+    Args:
+        vm_name: Name of the VM to check
+        want: Target state, e.g. "running" or "stopped"
+        timeout: Maximum time to wait in seconds (default: 30)
+        initial_delay: First delay between polls in seconds (default: 0.2)
+        max_delay: Upper bound for the delay between polls (default: 1.5)
+        on_info: Called with each decoded ``orbctl info`` payload, e.g. to
+            keep the last one around for the assertions after the wait
+
+    Returns:
+        True if the VM reached the state, False if timeout
+    """
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+
+    while time.monotonic() < deadline:
+        try:
+            result = subprocess.run(
+                ["orbctl", "info", vm_name, "--format", "json"],
+                capture_output=True,
+                timeout=5,
+            )
+            if result.returncode == 0:
+                info = loads_json(result.stdout)
+                if on_info is not None:
+                    on_info(info)
+                if get_nested(info, "record.state") == want:
+                    return True
+        except (subprocess.TimeoutExpired, JSONDecodeError):
+            pass
+
+        time.sleep(delay)
+        delay = min(delay * 1.8, max_delay)
+
+    return False
+
+
 def create_test_vm(reuse_worker_vm: bool = True) -> str:
     """
     Create or get a test VM.
@@ -436,15 +534,13 @@ def delete_vm_with_retry(vm_name: str, force: bool = True) -> bool:
     )
 
     if check_result.returncode == 0:
-        import json
-
         try:
-            vms = json.loads(check_result.stdout)
+            vms = loads_json(check_result.stdout)
             vm_exists = any(vm.get("name") == vm_name for vm in vms)
             if not vm_exists:
                 # VM doesn't exist, nothing to delete
                 return True
-        except (json.JSONDecodeError, KeyError):
+        except (JSONDecodeError, KeyError):
             # If we can't parse, proceed with deletion attempt
             pass
 
@@ -5,6 +5,8 @@ These tests demonstrate how extracting command construction logic
 into separate functions improves test coverage reporting.
 """
 
+import pytest
+
 from pyinfra_orbstack.operations.vm import (
     build_config_get_command,
     build_config_set_command,
@@ -28,150 +30,152 @@ from pyinfra_orbstack.operations.vm import (
     build_vm_username_set_command,
 )
 
-
-class TestVMCreateCommandBuilder:
-    """Test vm_create command builder."""
-
-    def test_basic_command(self):
-        """Test basic VM creation command."""
-        cmd = build_vm_create_command("test-vm", "ubuntu:22.04")
-        assert cmd == "orbctl create ubuntu:22.04 test-vm"
-
-    def test_with_arch(self):
-        """Test VM creation with architecture."""
-        cmd = build_vm_create_command("test-vm", "ubuntu:22.04", arch="arm64")
-        assert cmd == "orbctl create ubuntu:22.04 test-vm --arch arm64"
-
-    def test_with_user(self):
-        """Test VM creation with user."""
-        cmd = build_vm_create_command("test-vm", "ubuntu:22.04", user="ubuntu")
-        assert cmd == "orbctl create ubuntu:22.04 test-vm --user ubuntu"
-
-    def test_with_arch_and_user(self):
-        """Test VM creation with both arch and user."""
-        cmd = build_vm_create_command(
-            "test-vm", "ubuntu:22.04", arch="arm64", user="ubuntu"
-        )
-        assert cmd == "orbctl create ubuntu:22.04 test-vm --arch arm64 --user ubuntu"
-
-
-class TestVMCloneCommandBuilder:
-    """Test vm_clone command builder."""
-
-    def test_basic_clone(self):
-        """Test basic VM clone command."""
-        cmd = build_vm_clone_command("source-vm", "cloned-vm")
-        assert cmd == "orbctl clone source-vm cloned-vm"
-
-
-class TestVMExportCommandBuilder:
-    """Test vm_export command builder."""
-
-    def test_basic_export(self):
-        """Test basic VM export command."""
-        cmd = build_vm_export_command("test-vm", "/tmp/backup.tar.zst")
-        assert cmd == "orbctl export test-vm /tmp/backup.tar.zst"
-
-
-class TestVMImportCommandBuilder:
-    """Test vm_import command builder."""
-
-    def test_basic_import(self):
-        """Test basic VM import command."""
-        cmd = build_vm_import_command("/tmp/backup.tar.zst", "restored-vm")
-        assert cmd == "orbctl import -n restored-vm /tmp/backup.tar.zst"
-
-
-class TestVMRenameCommandBuilder:
-    """Test vm_rename command builder."""
-
-    def test_basic_rename(self):
-        """Test basic VM rename command."""
-        cmd = build_vm_rename_command("old-vm", "new-vm")
-        assert cmd == "orbctl rename old-vm new-vm"
-
-
-class TestVMDeleteCommandBuilder:
-    """Test vm_delete command builder."""
-
-    def test_basic_delete(self):
-        """Test basic VM delete command."""
-        cmd = build_vm_delete_command("test-vm")
-        assert cmd == "orbctl delete  test-vm"
-
-    def test_delete_with_force(self):
-        """Test VM delete with force flag."""
-        cmd = build_vm_delete_command("test-vm", force=True)
-        assert cmd == "orbctl delete -f test-vm"
-
-
-class TestVMLifecycleCommandBuilders:
-    """Test VM lifecycle command builders."""
-
-    def test_start_command(self):
-        """Test VM start command."""
-        cmd = build_vm_start_command("test-vm")
-        assert cmd == "orbctl start test-vm"
-
-    def test_stop_command(self):
-        """Test VM stop command."""
-        cmd = build_vm_stop_command("test-vm")
-        assert cmd == "orbctl stop  test-vm"
-
-    def test_stop_with_force(self):
-        """Test VM stop with force."""
-        cmd = build_vm_stop_command("test-vm", force=True)
-        assert cmd == "orbctl stop -f test-vm"
-
-    def test_restart_command(self):
-        """Test VM restart command."""
-        cmd = build_vm_restart_command("test-vm")
-        assert cmd == "orbctl restart test-vm"
-
-
-class TestVMInfoCommandBuilders:
-    """Test VM information command builders."""
-
-    def test_info_command(self):
-        """Test VM info command."""
-        cmd = build_vm_info_command("test-vm")
-        assert cmd == "orbctl info test-vm --format json"
-
-    def test_list_command(self):
-        """Test VM list command."""
-        cmd = build_vm_list_command()
-        assert cmd == "orbctl list -f json"
-
-
-class TestSSHCommandBuilders:
-    """Test SSH command builders."""
-
-    def test_ssh_info_with_machine(self):
-        """Test SSH info with machine name."""
-        cmd = build_ssh_info_command("test-vm")
-        assert cmd == "orbctl info test-vm --format json"
-
-    def test_ssh_info_without_machine(self):
-        """Test SSH info without machine name."""
-        cmd = build_ssh_info_command()
-        assert cmd == "orbctl ssh"
+# Expected commands for the workflow tests, built once at import time
+EXPECTED_EXPORT = "orbctl export production-vm /backups/production.tar.zst"
+EXPECTED_IMPORT = "orbctl import -n production-restored /backups/production.tar.zst"
+EXPECTED_CLONE = "orbctl clone base-vm base-vm-clone"
+EXPECTED_RENAME = "orbctl rename base-vm-clone production-vm"
+EXPECTED_CREATE_ARM64 = "orbctl create ubuntu:22.04 test-vm --arch arm64"
+EXPECTED_START = "orbctl start test-vm"
+EXPECTED_INFO = "orbctl info test-vm --format json"
+EXPECTED_STOP_FORCE = "orbctl stop -f test-vm"
+EXPECTED_DELETE_FORCE = "orbctl delete -f test-vm"
+
+
+# (builder, args, kwargs, expected command) golden cases
+CASES = [
+    pytest.param(
+        build_vm_create_command,
+        ("test-vm", "ubuntu:22.04"),
+        {},
+        "orbctl create ubuntu:22.04 test-vm",
+        id="create",
+    ),
+    pytest.param(
+        build_vm_create_command,
+        ("test-vm", "ubuntu:22.04"),
+        {"arch": "arm64"},
+        "orbctl create ubuntu:22.04 test-vm --arch arm64",
+        id="create-arch",
+    ),
+    pytest.param(
+        build_vm_create_command,
+        ("test-vm", "ubuntu:22.04"),
+        {"user": "ubuntu"},
+        "orbctl create ubuntu:22.04 test-vm --user ubuntu",
+        id="create-user",
+    ),
+    pytest.param(
+        build_vm_create_command,
+        ("test-vm", "ubuntu:22.04"),
+        {"arch": "arm64", "user": "ubuntu"},
+        "orbctl create ubuntu:22.04 test-vm --arch arm64 --user ubuntu",
+        id="create-arch-user",
+    ),
+    pytest.param(
+        build_vm_clone_command,
+        ("source-vm", "cloned-vm"),
+        {},
+        "orbctl clone source-vm cloned-vm",
+        id="clone",
+    ),
+    pytest.param(
+        build_vm_export_command,
+        ("test-vm", "/tmp/backup.tar.zst"),
+        {},
+        "orbctl export test-vm /tmp/backup.tar.zst",
+        id="export",
+    ),
+    pytest.param(
+        build_vm_import_command,
+        ("/tmp/backup.tar.zst", "restored-vm"),
+        {},
+        "orbctl import -n restored-vm /tmp/backup.tar.zst",
+        id="import",
+    ),
+    pytest.param(
+        build_vm_rename_command,
+        ("old-vm", "new-vm"),
+        {},
+        "orbctl rename old-vm new-vm",
+        id="rename",
+    ),
+    pytest.param(
+        build_vm_delete_command,
+        ("test-vm",),
+        {},
+        "orbctl delete  test-vm",
+        id="delete",
+    ),
+    pytest.param(
+        build_vm_delete_command,
+        ("test-vm",),
+        {"force": True},
+        "orbctl delete -f test-vm",
+        id="delete-force",
+    ),
+    pytest.param(
+        build_vm_start_command, ("test-vm",), {}, "orbctl start test-vm", id="start"
+    ),
+    pytest.param(
+        build_vm_stop_command, ("test-vm",), {}, "orbctl stop  test-vm", id="stop"
+    ),
+    pytest.param(
+        build_vm_stop_command,
+        ("test-vm",),
+        {"force": True},
+        "orbctl stop -f test-vm",
+        id="stop-force",
+    ),
+    pytest.param(
+        build_vm_restart_command,
+        ("test-vm",),
+        {},
+        "orbctl restart test-vm",
+        id="restart",
+    ),
+    pytest.param(
+        build_vm_info_command,
+        ("test-vm",),
+        {},
+        "orbctl info test-vm --format json",
+        id="info",
+    ),
+    pytest.param(build_vm_list_command, (), {}, "orbctl list -f json", id="list"),
+    pytest.param(
+        build_ssh_info_command,
+        ("test-vm",),
+        {},
+        "orbctl info test-vm --format json",
+        id="ssh-info-machine",
+    ),
+    pytest.param(build_ssh_info_command, (), {}, "orbctl ssh", id="ssh-info"),
+]
+
+
+@pytest.mark.parametrize("fn,args,kwargs,expected", CASES)
+def test_builder_golden(fn, args, kwargs, expected):
+    """Test that each VM command builder produces the exact expected command."""
+    assert fn(*args, **kwargs) == expected
 
 
 class TestCommandBuilderEdgeCases:
     """Test edge cases for command builders."""
 
-    def test_vm_names_with_special_characters(self):
-        """Test VM names with special characters."""
-        names = [
+    @pytest.mark.parametrize(
+        "old_name,new_name",
+        [
             ("test-vm-01", "test_vm_01"),
             ("web-server", "web_server"),
             ("db_01", "db-01"),
-        ]
-
-        for old_name, new_name in names:
-            cmd = build_vm_rename_command(old_name, new_name)
-            assert old_name in cmd
-            assert new_name in cmd
+            ("vm.with.dots", "VM-Upper-01"),
+            ("a", "z9"),
+        ],
+    )
+    def test_vm_names_with_special_characters(self, old_name, new_name):
+        """Test VM names with special characters."""
+        cmd = build_vm_rename_command(old_name, new_name)
+        assert cmd == f"orbctl rename {old_name} {new_name}"
 
     def test_export_paths_with_spaces(self):
         """Test export paths with special characters."""
@@ -180,19 +184,14 @@ class TestCommandBuilderEdgeCases:
         assert "test-vm" in cmd
         assert "/tmp/my backup.tar.zst" in cmd
 
-    def test_image_formats(self):
+    @pytest.mark.parametrize(
+        "image",
+        ["ubuntu:22.04", "alpine:latest", "debian:bullseye", "centos:7", "fedora"],
+    )
+    def test_image_formats(self, image):
         """Test various image formats."""
-        images = [
-            "ubuntu:22.04",
-            "alpine:latest",
-            "debian:bullseye",
-            "centos:7",
-        ]
-
-        for image in images:
-            cmd = build_vm_create_command("test-vm", image)
-            assert image in cmd
-            assert "orbctl create" in cmd
+        cmd = build_vm_create_command("test-vm", image)
+        assert cmd == f"orbctl create {image} test-vm"
 
 
 class TestCommandBuilderIntegration:
@@ -206,11 +205,11 @@ class TestCommandBuilderIntegration:
 
         # Export command
         export_cmd = build_vm_export_command(vm_name, backup_path)
-        assert export_cmd == f"orbctl export {vm_name} {backup_path}"
+        assert export_cmd == EXPECTED_EXPORT
 
         # Import command
         import_cmd = build_vm_import_command(backup_path, restore_name)
-        assert import_cmd == f"orbctl import -n {restore_name} {backup_path}"
+        assert import_cmd == EXPECTED_IMPORT
 
     def test_clone_rename_workflow_commands(self):
         """Test commands for clone and rename workflow."""
@@ -220,11 +219,11 @@ class TestCommandBuilderIntegration:
 
         # Clone command
         clone_cmd = build_vm_clone_command(source, clone)
-        assert clone_cmd == f"orbctl clone {source} {clone}"
+        assert clone_cmd == EXPECTED_CLONE
 
         # Rename command
         rename_cmd = build_vm_rename_command(clone, final)
-        assert rename_cmd == f"orbctl rename {clone} {final}"
+        assert rename_cmd == EXPECTED_RENAME
 
     def test_lifecycle_workflow_commands(self):
         """Test complete lifecycle workflow commands."""
@@ -233,26 +232,23 @@ class TestCommandBuilderIntegration:
 
         # Create
         create_cmd = build_vm_create_command(vm_name, image, arch="arm64")
-        assert "orbctl create" in create_cmd
-        assert vm_name in create_cmd
-        assert image in create_cmd
-        assert "--arch arm64" in create_cmd
+        assert create_cmd == EXPECTED_CREATE_ARM64
 
         # Start
         start_cmd = build_vm_start_command(vm_name)
-        assert start_cmd == f"orbctl start {vm_name}"
+        assert start_cmd == EXPECTED_START
 
         # Info
         info_cmd = build_vm_info_command(vm_name)
-        assert info_cmd == f"orbctl info {vm_name} --format json"
+        assert info_cmd == EXPECTED_INFO
 
         # Stop
         stop_cmd = build_vm_stop_command(vm_name, force=True)
-        assert "orbctl stop -f" in stop_cmd
+        assert stop_cmd == EXPECTED_STOP_FORCE
 
         # Delete
         delete_cmd = build_vm_delete_command(vm_name, force=True)
-        assert "orbctl delete -f" in delete_cmd
+        assert delete_cmd == EXPECTED_DELETE_FORCE
 
 
 # Phase 3B: Configuration Management Command Builder Tests
@@ -632,8 +628,6 @@ class TestVMTestConnectivityCommandBuilder:
 
     def test_invalid_method_raises_error(self):
         """Test that invalid connectivity method raises ValueError."""
-        import pytest
-
         with pytest.raises(ValueError, match="Unsupported connectivity test method"):
             build_vm_test_connectivity_command("target", method="invalid")
 
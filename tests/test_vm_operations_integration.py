@@ -5,124 +5,151 @@ These tests require macOS with OrbStack installed and running.
 Tests are automatically skipped if conditions are not met.
 """
 
-import json
-import platform
+import secrets
+import shutil
 import subprocess
 import time
-from unittest import TestCase
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
 
 import pytest
 
+from tests.conftest import check_orbstack_available
 from tests.test_utils import (
     create_test_vm,
     create_vm_with_retry,
     delete_vm_with_retry,
+    loads_json,
     start_vm_with_retry,
     stop_vm_with_retry,
+    wait_for_vm_ready,
+    wait_for_vm_state,
 )
 
+# Absolute path to orbctl, resolved in-process once so child processes skip
+# the PATH walk; None when it is not installed (the module is skipped then)
+ORBCTL = shutil.which("orbctl")
 
-def check_orbstack_available():
-    """Check if OrbStack is available and running."""
-    try:
-        # Check if we're on macOS
-        if platform.system() != "Darwin":
-            return False, "Not running on macOS"
+# Shared orbctl argv prefixes
+LIST_CMD = (ORBCTL, "list", "--format", "json")
+INFO_CMD = (ORBCTL, "info")
+DELETE_FORCE = (ORBCTL, "delete", "--force")
+
+# Skip all tests in this module if OrbStack is not available
+orbstack_available, orbstack_reason = check_orbstack_available()
+
+if not orbstack_available:
+    pytest.skip(f"OrbStack not available: {orbstack_reason}", allow_module_level=True)
 
-        # Check if orbctl is available
-        result = subprocess.run(
-            ["which", "orbctl"], capture_output=True, text=True, timeout=5
-        )
-        if result.returncode != 0:
-            return False, "orbctl not found in PATH"
 
-        # Check if OrbStack is running
+@pytest.fixture
+def orb_list():
+    """Return a callable that snapshots ``orbctl list`` as a name -> VM dict."""
+
+    def snapshot():
         result = subprocess.run(
-            ["orbctl", "status"], capture_output=True, text=True, timeout=10
+            LIST_CMD,
+            capture_output=True,
+            timeout=10,
         )
-        if result.returncode != 0:
-            return False, "OrbStack is not running"
+        assert result.returncode == 0, f"VM list failed: {result.stderr.decode()}"
+        return {vm["name"]: vm for vm in loads_json(result.stdout)}
 
-        return True, "OrbStack is available"
+    return snapshot
 
-    except subprocess.TimeoutExpired:
-        return False, "Timeout checking OrbStack status"
-    except Exception as e:
-        return False, f"Error checking OrbStack: {e}"
 
+@dataclass
+class VMInfo:
+    """The ``orbctl info --format json`` fields the tests assert on."""
 
-# Skip all tests in this module if OrbStack is not available
-orbstack_available, orbstack_reason = check_orbstack_available()
+    # Declared by hand because dataclass(slots=True) needs Python 3.10
+    __slots__ = ("name", "state", "record")
 
-if not orbstack_available:
-    pytest.skip(f"OrbStack not available: {orbstack_reason}", allow_module_level=True)
+    name: Optional[str]
+    state: Optional[str]
+    record: Optional[dict]
 
+    @classmethod
+    def from_json(cls, payload):
+        """Decode an ``orbctl info`` payload once into a VMInfo."""
+        data = loads_json(payload)
+        return cls(data.get("name"), data.get("state"), data.get("record"))
 
-class TestVMOperationsIntegration(TestCase):
+
+def _vm_exists(name):
+    """Check a single VM by ``orbctl info`` exit status, without listing all VMs."""
+    result = subprocess.run(
+        [*INFO_CMD, name],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        timeout=10,
+    )
+    return result.returncode == 0
+
+
+class TestVMOperationsIntegration:
     """Integration tests for VM operations using direct orbctl commands."""
 
-    def setUp(self):
-        """Set up test environment."""
-        self.test_vm_name = f"test-vm-{int(time.time())}"
+    @pytest.fixture(autouse=True)
+    def _test_vm(self):
+        """Set up the test VM name and clean up the VMs the test created."""
+        self.test_vm_name = f"test-vm-{secrets.token_hex(4)}"
         self.test_image = "ubuntu:22.04"
+        self._created = set()
+
+        yield self.test_vm_name
+
+        # Clean up the VMs this test created and didn't delete itself (tests
+        # discard a name from _created after deleting it) with one orbctl call
+        if not self._created:
+            return
+        try:
+            subprocess.run(
+                [*DELETE_FORCE, *self._created],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=30,
+            )
+        except subprocess.TimeoutExpired:
+            pass
+
+    def _create(self, name, **kwargs):
+        """Create a VM with create_vm_with_retry and track it for cleanup."""
+        success = create_vm_with_retry(self.test_image, name, **kwargs)
+        if success:
+            self._created.add(name)
+        return success
 
-    def tearDown(self):
-        """Clean up test environment."""
-        # Clean up any remaining test VMs
-        for vm_name in [
-            self.test_vm_name,
-            f"{self.test_vm_name}-arm64",
-            f"{self.test_vm_name}-user",
-        ]:
-            delete_vm_with_retry(vm_name, force=True)
-
-    def test_vm_list_integration(self):
+    def test_vm_list_integration(self, orb_list):
         """Test VM list operation with real OrbStack."""
         # Get actual VM list using orbctl directly
-        result = subprocess.run(
-            ["orbctl", "list", "--format", "json"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-
-        assert result.returncode == 0
-        vms = json.loads(result.stdout)
-        assert isinstance(vms, list)
+        vms_by_name = orb_list()
 
         # Verify VM structure if VMs exist
-        if vms:
-            vm_data = vms[0]
-            assert "name" in vm_data
+        for vm_data in vms_by_name.values():
             assert "state" in vm_data
 
     def test_vm_create_and_delete_integration(self):
         """Test VM creation and deletion with real OrbStack."""
         # Test VM creation using resilient utility
-        assert create_vm_with_retry(
-            self.test_image, self.test_vm_name
+        assert self._create(
+            self.test_vm_name
         ), f"VM creation failed for {self.test_vm_name}"
 
-        # Wait a moment for VM to be created
-        time.sleep(2)
+        # Wait for VM to come up
+        assert wait_for_vm_state(
+            self.test_vm_name, "running"
+        ), "VM did not reach running"
 
         # Verify VM exists
-        list_result = subprocess.run(
-            ["orbctl", "list", "--format", "json"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-
-        assert list_result.returncode == 0
-        vms = json.loads(list_result.stdout)
-        vm_exists = any(vm.get("name") == self.test_vm_name for vm in vms)
-        assert vm_exists, "Created VM not found in list"
+        assert _vm_exists(self.test_vm_name), "Created VM not found"
 
         # Test VM deletion
         delete_result = subprocess.run(
-            ["orbctl", "delete", "--force", self.test_vm_name],
-            capture_output=True,
+            [*DELETE_FORCE, self.test_vm_name],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
             timeout=30,
         )
@@ -130,42 +157,26 @@ class TestVMOperationsIntegration(TestCase):
         assert (
             delete_result.returncode == 0
         ), f"VM deletion failed: {delete_result.stderr}"
+        self._created.discard(self.test_vm_name)
 
         # Verify VM is deleted
-        list_result = subprocess.run(
-            ["orbctl", "list", "--format", "json"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-
-        assert list_result.returncode == 0
-        vms = json.loads(list_result.stdout)
-        vm_exists = any(vm.get("name") == self.test_vm_name for vm in vms)
-        assert not vm_exists, "VM still exists after deletion"
+        assert not _vm_exists(self.test_vm_name), "VM still exists after deletion"
 
     def test_vm_create_with_arch_integration(self):
         """Test VM creation with architecture specification."""
         # Test VM creation with arm64 architecture using resilient function
-        arm64_vm_name = f"{self.test_vm_name}-arm64"
-        success = create_vm_with_retry(self.test_image, arm64_vm_name, arch="arm64")
-
         # Note: This might fail if arm64 is not supported on the current system
-        # We'll just verify the command structure is correct
-        if success:
-            # Clean up if creation succeeded
-            delete_vm_with_retry(arm64_vm_name, force=True)
+        # We'll just verify the command structure is correct; the _test_vm
+        # fixture cleans up if creation succeeded
+        self._create(f"{self.test_vm_name}-arm64", arch="arm64")
 
     def test_vm_create_with_user_integration(self):
         """Test VM creation with user specification."""
-        # Test VM creation with specific user using resilient function
-        user_vm_name = f"{self.test_vm_name}-user"
-        success = create_vm_with_retry(self.test_image, user_vm_name, user="ubuntu")
-
-        if success:
-            # Clean up if creation succeeded
-            delete_vm_with_retry(user_vm_name, force=True)
+        # Test VM creation with specific user using resilient function;
+        # the _test_vm fixture cleans up if creation succeeded
+        self._create(f"{self.test_vm_name}-user", user="ubuntu")
 
+    @pytest.mark.slow
     def test_vm_lifecycle_integration(self):
         """Test complete VM lifecycle: create, start, stop, restart, delete.
 
@@ -174,109 +185,82 @@ class TestVMOperationsIntegration(TestCase):
         the consolidated version provides more comprehensive coverage.
         """
         # Create VM using resilient function
-        assert create_vm_with_retry(
-            self.test_image, self.test_vm_name
-        ), "VM creation failed"
+        assert self._create(self.test_vm_name), "VM creation failed"
 
         # Wait for VM to be ready
-        time.sleep(5)
+        assert wait_for_vm_state(
+            self.test_vm_name, "running"
+        ), "VM did not reach running"
 
         # Start VM using resilient function
         assert start_vm_with_retry(self.test_vm_name), "VM start failed"
 
         # Wait for VM to start
-        time.sleep(10)
+        assert wait_for_vm_state(
+            self.test_vm_name, "running"
+        ), "VM did not reach running"
 
         # Get VM info to verify it's running
         info_result = subprocess.run(
-            ["orbctl", "info", self.test_vm_name, "--format", "json"],
+            [*INFO_CMD, self.test_vm_name, "--format", "json"],
             capture_output=True,
-            text=True,
             timeout=10,
         )
 
         if info_result.returncode == 0:
-            vm_info = json.loads(info_result.stdout)
+            vm_info = VMInfo.from_json(info_result.stdout)
             # Note: The exact state field might vary depending on OrbStack version
-            assert "state" in vm_info or "record" in vm_info
+            assert vm_info.state is not None or vm_info.record is not None
 
         # Stop VM using resilient function
         assert stop_vm_with_retry(self.test_vm_name), "VM stop failed"
 
         # Wait for VM to stop
-        time.sleep(5)
+        assert wait_for_vm_state(
+            self.test_vm_name, "stopped"
+        ), "VM did not reach stopped"
 
         # Delete VM using resilient function
         assert delete_vm_with_retry(self.test_vm_name, force=True), "VM deletion failed"
+        self._created.discard(self.test_vm_name)
 
         # Verify VM is deleted
-        list_result = subprocess.run(
-            ["orbctl", "list", "--format", "json"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        assert list_result.returncode == 0
-        vms = json.loads(list_result.stdout)
-        vm_exists = any(vm.get("name") == self.test_vm_name for vm in vms)
-        assert not vm_exists, "VM still exists after deletion"
-
-    def test_vm_info_integration(self):
-        """Test VM info retrieval functionality."""
-        # Create VM using resilient function
-        assert create_vm_with_retry(
-            self.test_image, self.test_vm_name
-        ), "VM creation failed"
-
-        # Wait for VM to be ready
-        time.sleep(5)
-
-        # Get VM info
-        info_result = subprocess.run(
-            ["orbctl", "info", self.test_vm_name, "--format", "json"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-
-        assert info_result.returncode == 0, f"VM info failed: {info_result.stderr}"
-
-        vm_info = json.loads(info_result.stdout)
-        assert isinstance(vm_info, dict), "VM info should be a dictionary"
-
-        # Verify VM info contains expected fields
-        assert (
-            "name" in vm_info or "record" in vm_info
-        ), "VM info should contain name or record"
-
-        # Clean up
-        assert delete_vm_with_retry(self.test_vm_name, force=True), "VM deletion failed"
+        assert not _vm_exists(self.test_vm_name), "VM still exists after deletion"
 
     def test_vm_force_operations_integration(self):
         """Test force operations (force stop, force delete)."""
         # Create a test VM
         create_result = subprocess.run(
-            ["orbctl", "create", self.test_image, self.test_vm_name],
-            capture_output=True,
-            text=True,
+            [ORBCTL, "create", self.test_image, self.test_vm_name],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=60,
         )
 
         if create_result.returncode == 0:
+            self._created.add(self.test_vm_name)
+
             # Wait for VM to be ready
-            time.sleep(5)
+            assert wait_for_vm_state(
+                self.test_vm_name, "running"
+            ), "VM did not reach running"
 
             # Start VM
             subprocess.run(
-                ["orbctl", "start", self.test_vm_name], capture_output=True, timeout=30
+                [ORBCTL, "start", self.test_vm_name],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=30,
             )
-
-            time.sleep(5)
+            assert wait_for_vm_state(
+                self.test_vm_name, "running"
+            ), "VM did not reach running"
 
             # Test force stop
             force_stop_result = subprocess.run(
-                ["orbctl", "stop", "--force", self.test_vm_name],
-                capture_output=True,
+                [ORBCTL, "stop", "--force", self.test_vm_name],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=30,
             )
@@ -287,8 +271,9 @@ class TestVMOperationsIntegration(TestCase):
 
             # Test force delete
             force_delete_result = subprocess.run(
-                ["orbctl", "delete", "--force", self.test_vm_name],
-                capture_output=True,
+                [*DELETE_FORCE, self.test_vm_name],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=30,
             )
@@ -296,41 +281,33 @@ class TestVMOperationsIntegration(TestCase):
             assert (
                 force_delete_result.returncode == 0
             ), f"Force delete failed: {force_delete_result.stderr}"
+            self._created.discard(self.test_vm_name)
 
     def test_vm_error_handling_integration(self):
         """Test error handling for invalid operations."""
-        # Test deleting non-existent VM
-        delete_result = subprocess.run(
-            ["orbctl", "delete", "non-existent-vm"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-
-        # Should fail (non-zero return code)
-        assert delete_result.returncode != 0
-
-        # Test starting non-existent VM
-        start_result = subprocess.run(
-            ["orbctl", "start", "non-existent-vm"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-
-        # Should fail (non-zero return code)
-        assert start_result.returncode != 0
-
-        # Test getting info for non-existent VM
-        info_result = subprocess.run(
-            ["orbctl", "info", "non-existent-vm", "--format", "json"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
+        # Deleting, starting and getting info for a non-existent VM are
+        # independent, so run the probes in parallel
+        commands = [
+            [ORBCTL, "delete", "non-existent-vm"],
+            [ORBCTL, "start", "non-existent-vm"],
+            [*INFO_CMD, "non-existent-vm", "--format", "json"],
+        ]
+        with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+            results = list(
+                executor.map(
+                    lambda command: subprocess.run(
+                        command,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        timeout=10,
+                    ),
+                    commands,
+                )
+            )
 
-        # Should fail (non-zero return code)
-        assert info_result.returncode != 0
+        # Each should fail (non-zero return code)
+        for command, result in zip(commands, results):
+            assert result.returncode != 0, f"{command[1]} unexpectedly succeeded"
 
     def test_vm_concurrent_operations_integration(self):
         """Test concurrent VM operations."""
@@ -341,44 +318,50 @@ class TestVMOperationsIntegration(TestCase):
         create_processes = []
         for vm_name in vm_names:
             process = subprocess.Popen(
-                ["orbctl", "create", self.test_image, vm_name],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
+                [ORBCTL, "create", self.test_image, vm_name],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
             create_processes.append((process, vm_name))
 
         # Wait for all creations to complete with shorter timeout
+        created = []
         for process, vm_name in create_processes:
             try:
-                returncode = process.wait(timeout=30)
-                if returncode == 0:
-                    # Clean up successful creations
-                    subprocess.run(
-                        ["orbctl", "delete", "--force", vm_name],
-                        capture_output=True,
-                        timeout=30,
-                    )
+                if process.wait(timeout=30) == 0:
+                    created.append(vm_name)
             except subprocess.TimeoutExpired:
                 # Kill the process if it times out
                 process.kill()
                 process.wait()
 
+        # Clean up successful creations with a single delete
+        if created:
+            subprocess.run(
+                [*DELETE_FORCE, *created],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=30,
+            )
+
+    @pytest.mark.slow
     def test_vm_performance_integration(self):
         """Test VM operation performance."""
         # Measure VM creation time
         start_time = time.time()
 
         create_result = subprocess.run(
-            ["orbctl", "create", self.test_image, self.test_vm_name],
-            capture_output=True,
-            text=True,
+            [ORBCTL, "create", self.test_image, self.test_vm_name],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=120,
         )
 
         creation_time = time.time() - start_time
 
         if create_result.returncode == 0:
+            self._created.add(self.test_vm_name)
+
             # VM creation should complete within reasonable time (2 minutes)
             assert creation_time < 120.0
 
@@ -386,9 +369,9 @@ class TestVMOperationsIntegration(TestCase):
             start_time = time.time()
 
             delete_result = subprocess.run(
-                ["orbctl", "delete", "--force", self.test_vm_name],
-                capture_output=True,
-                text=True,
+                [*DELETE_FORCE, self.test_vm_name],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=60,
             )
 
@@ -397,61 +380,53 @@ class TestVMOperationsIntegration(TestCase):
             # VM deletion should complete within reasonable time (1 minute)
             assert deletion_time < 60.0
             assert delete_result.returncode == 0
+            self._created.discard(self.test_vm_name)
 
-    def test_vm_network_integration(self):
-        """Test VM network functionality."""
-        # Create a test VM
-        create_result = subprocess.run(
-            ["orbctl", "create", self.test_image, self.test_vm_name],
+
+class TestVMReadOnlyIntegration:
+    """Read-only VM checks that share the session's worker VM."""
+
+    def test_vm_info_integration(self, worker_vm):
+        """Test VM info retrieval functionality."""
+        # Get VM info
+        info_result = subprocess.run(
+            [*INFO_CMD, worker_vm, "--format", "json"],
             capture_output=True,
-            text=True,
-            timeout=60,
+            timeout=10,
         )
 
-        if create_result.returncode == 0:
-            # Wait for VM to be ready
-            time.sleep(10)
+        assert (
+            info_result.returncode == 0
+        ), f"VM info failed: {info_result.stderr.decode()}"
 
-            # Start VM
-            start_result = subprocess.run(
-                ["orbctl", "start", self.test_vm_name],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+        vm_info = VMInfo.from_json(info_result.stdout)
 
-            if start_result.returncode == 0:
-                # Wait for VM to start and get network
-                time.sleep(15)
+        # Verify VM info contains expected fields
+        assert (
+            vm_info.name is not None or vm_info.record is not None
+        ), "VM info should contain name or record"
 
-                # Get VM info to check network
-                info_result = subprocess.run(
-                    ["orbctl", "info", self.test_vm_name, "--format", "json"],
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                )
+    def test_vm_network_integration(self, worker_vm):
+        """Test VM network functionality."""
+        # Wait for the VM to be running with an IP
+        assert wait_for_vm_ready(worker_vm), "Worker VM did not become ready"
 
-                if info_result.returncode == 0:
-                    vm_info = json.loads(info_result.stdout)
+        # Get VM info to check network
+        info_result = subprocess.run(
+            [*INFO_CMD, worker_vm, "--format", "json"],
+            capture_output=True,
+            timeout=10,
+        )
 
-                    # Check for network information
-                    # has_network_info = (
-                    #     "ip4" in vm_info
-                    #     or "ip6" in vm_info
-                    #     or ("record" in vm_info and "mac" in vm_info.get("record", {}))
-                    # )
+        assert (
+            info_result.returncode == 0
+        ), f"VM info failed: {info_result.stderr.decode()}"
 
-                    # Network info might not be immediately available
-                    # This is more of a verification that the command works
-                    assert isinstance(vm_info, dict)
+        vm_info = loads_json(info_result.stdout)
 
-            # Clean up
-            subprocess.run(
-                ["orbctl", "delete", "--force", self.test_vm_name],
-                capture_output=True,
-                timeout=30,
-            )
+        # Network info might not be immediately available
+        # This is more of a verification that the command works
+        assert isinstance(vm_info, dict)
 
 
 class TestVMOperationsEdgeCasesIntegration:
@@ -461,9 +436,9 @@ class TestVMOperationsEdgeCasesIntegration:
         """Test VM creation with invalid image."""
         # Test with non-existent image
         create_result = subprocess.run(
-            ["orbctl", "create", "invalid:image:tag", "test-invalid-vm"],
-            capture_output=True,
-            text=True,
+            [ORBCTL, "create", "invalid:image:tag", "test-invalid-vm"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=30,
         )
 
@@ -475,15 +450,15 @@ class TestVMOperationsEdgeCasesIntegration:
         # Test with invalid architecture
         create_result = subprocess.run(
             [
-                "orbctl",
+                ORBCTL,
                 "create",
                 "ubuntu:22.04",
                 "test-invalid-arch",
                 "--arch",
                 "invalid-arch",
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=30,
         )
 
@@ -496,15 +471,15 @@ class TestVMOperationsEdgeCasesIntegration:
         try:
             create_result = subprocess.run(
                 [
-                    "orbctl",
+                    ORBCTL,
                     "create",
                     "ubuntu:22.04",
                     "test-invalid-user",
                     "--user",
                     "invalid-user",
                 ],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=15,
             )
             # Should fail (non-zero return code)
@@ -520,17 +495,7 @@ class TestVMOperationsEdgeCasesIntegration:
 
         # Verify VM was created and has expected name format
         # (includes hyphens, which are "special" characters for VM names)
-        list_result = subprocess.run(
-            ["orbctl", "list", "--format", "json"],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-
-        assert list_result.returncode == 0, "Failed to list VMs"
-        vms = json.loads(list_result.stdout)
-        vm_exists = any(vm.get("name") == vm_name for vm in vms)
-        assert vm_exists, f"VM {vm_name} not found in list"
+        assert _vm_exists(vm_name), f"VM {vm_name} not found"
 
         # Verify VM name contains special characters (hyphens)
         assert "-" in vm_name, "VM name should contain hyphens"
@@ -541,9 +506,9 @@ class TestVMOperationsEdgeCasesIntegration:
         """Test VM operations with empty name."""
         # Test with empty VM name
         create_result = subprocess.run(
-            ["orbctl", "create", "ubuntu:22.04", ""],
-            capture_output=True,
-            text=True,
+            [ORBCTL, "create", "ubuntu:22.04", ""],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=30,
         )
 
@@ -557,9 +522,9 @@ class TestVMOperationsEdgeCasesIntegration:
 
         try:
             create_result = subprocess.run(
-                ["orbctl", "create", "ubuntu:22.04", large_name],
-                capture_output=True,
-                text=True,
+                [ORBCTL, "create", "ubuntu:22.04", large_name],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=15,
             )
 
@@ -567,8 +532,9 @@ class TestVMOperationsEdgeCasesIntegration:
             if create_result.returncode == 0:
                 # Clean up if creation succeeded
                 subprocess.run(
-                    ["orbctl", "delete", "-f", large_name],
-                    capture_output=True,
+                    [*DELETE_FORCE, large_name],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                     timeout=30,
                 )
         except subprocess.TimeoutExpired:
@@ -3,102 +3,110 @@ Unit tests for Phase 2 VM operations (cloning, export/import, SSH).
 
 These tests verify that Phase 2 operations generate the correct orbctl commands
 without actually executing them.
-"""
-
-
-class TestVMCloneOperations:
-    """Test VM cloning operations command construction."""
-
-    def test_vm_clone_command_basic(self):
-        """Test basic VM clone command construction."""
-        source_name = "source-vm"
-        new_name = "cloned-vm"
-
-        # The command should be: orbctl clone source-vm cloned-vm
-        expected_command = f"orbctl clone {source_name} {new_name}"
-
-        assert "orbctl clone" in expected_command
-        assert source_name in expected_command
-        assert new_name in expected_command
-
-    def test_vm_clone_command_with_special_chars(self):
-        """Test VM clone command with special characters in names."""
-        source_name = "source-vm-01"
-        new_name = "cloned-vm_backup"
-
-        expected_command = f"orbctl clone {source_name} {new_name}"
 
-        assert "orbctl clone" in expected_command
-        assert source_name in expected_command
-        assert new_name in expected_command
-
-    def test_vm_clone_command_validation(self):
-        """Test VM clone command parameter validation."""
-        # Valid clone scenarios
-        scenarios = [
-            ("ubuntu-vm", "ubuntu-vm-clone"),
-            ("web-server", "web-server-backup"),
-            ("db-01", "db-01-test"),
-            ("test_vm", "test_vm_copy"),
-        ]
+Commands are mostly checked by matching them against precompiled patterns
+and comparing the captured groups, where pytest's rewritten failure output
+adds little over the match itself, so this module skips assertion
+rewriting: PYTEST_DONT_REWRITE
+"""
 
-        for source, target in scenarios:
-            command = f"orbctl clone {source} {target}"
-            assert "orbctl clone" in command
-            assert source in command
-            assert target in command
+import re
+
+import pytest
+
+from pyinfra_orbstack.operations.vm import (
+    build_ssh_info_command,
+    build_vm_clone_command,
+    build_vm_create_command,
+    build_vm_export_command,
+    build_vm_import_command,
+    build_vm_rename_command,
+)
+
+# Full-command shapes, so each check scans the command once
+_CLONE_RE = re.compile(r"orbctl clone (\S+) (\S+)")
+_EXPORT_RE = re.compile(r"orbctl export (\S+) (\S+)")
+_IMPORT_RE = re.compile(r"orbctl import -n (\S+) (\S+)")
+_RENAME_RE = re.compile(r"orbctl rename (\S+) (\S+)")
+_INFO_RE = re.compile(r"orbctl info (\S+) --format json")
+
+# (source_name, new_name)
+CLONE_CASES = [
+    ("source-vm", "cloned-vm"),
+    ("source-vm-01", "cloned-vm_backup"),
+    ("ubuntu-vm", "ubuntu-vm-clone"),
+    ("web-server", "web-server-backup"),
+    ("db-01", "db-01-test"),
+    ("test_vm", "test_vm_copy"),
+]
+
+# (vm_name, output_path)
+EXPORT_CASES = [
+    ("test-vm", "/tmp/test-vm-backup.tar.zst"),
+    ("web-server", "backups/web-server.tar.zst"),
+    ("test-vm", "/tmp/backup.tar.zst"),
+    ("test-vm", "backup.tar.zst"),
+    ("test-vm", "./backups/vm.tar.zst"),
+    ("test-vm", "/home/user/backups/test-vm-2024.tar.zst"),
+]
+
+# (input_path, vm_name)
+IMPORT_CASES = [
+    ("/tmp/test-vm-backup.tar.zst", "restored-vm"),
+    ("backups/web-server.tar.zst", "web-server-restored"),
+]
+
+# (old_name, new_name)
+RENAME_CASES = [
+    ("old-vm", "new-vm"),
+    ("test-vm-01", "prod-vm_v2"),
+    ("dev-server", "prod-server"),
+    ("test_vm", "production_vm"),
+    ("web-01", "web-02"),
+    ("old_name", "new-name"),
+]
+
+SSH_INFO_MACHINES = [
+    "test-vm",
+    "web-server",
+    "ubuntu-vm",
+    "web-server-01",
+    "db_server",
+    "test-machine",
+]
+
+
+# VM cloning operations command construction
+@pytest.mark.parametrize("source_name,new_name", CLONE_CASES)
+def test_vm_clone_command(source_name, new_name):
+    """Test VM clone command construction."""
+    # The command should be: orbctl clone <source> <new>
+    expected_command = build_vm_clone_command(source_name, new_name)
+
+    match = _CLONE_RE.fullmatch(expected_command)
+    assert match and match.groups() == (source_name, new_name)
 
 
 class TestVMExportImportOperations:
     """Test VM export/import operations command construction."""
 
-    def test_vm_export_command_basic(self):
-        """Test basic VM export command construction."""
-        vm_name = "test-vm"
-        output_path = "/tmp/test-vm-backup.tar.zst"
-
-        # The command should be: orbctl export test-vm /tmp/test-vm-backup.tar.zst
-        expected_command = f"orbctl export {vm_name} {output_path}"
-
-        assert "orbctl export" in expected_command
-        assert vm_name in expected_command
-        assert output_path in expected_command
-
-    def test_vm_export_command_with_relative_path(self):
-        """Test VM export command with relative path."""
-        vm_name = "web-server"
-        output_path = "backups/web-server.tar.zst"
-
-        expected_command = f"orbctl export {vm_name} {output_path}"
-
-        assert "orbctl export" in expected_command
-        assert vm_name in expected_command
-        assert output_path in expected_command
+    @pytest.mark.parametrize("vm_name,output_path", EXPORT_CASES)
+    def test_vm_export_command(self, vm_name, output_path):
+        """Test VM export command construction."""
+        # The command should be: orbctl export <name> <path>
+        expected_command = build_vm_export_command(vm_name, output_path)
 
-    def test_vm_import_command_basic(self):
-        """Test basic VM import command construction."""
-        input_path = "/tmp/test-vm-backup.tar.zst"
-        vm_name = "restored-vm"
+        match = _EXPORT_RE.fullmatch(expected_command)
+        assert match and match.groups() == (vm_name, output_path)
 
-        # The command should be: orbctl import -n restored-vm /tmp/test-vm-backup.tar.zst
-        expected_command = f"orbctl import -n {vm_name} {input_path}"
+    @pytest.mark.parametrize("input_path,vm_name", IMPORT_CASES)
+    def test_vm_import_command(self, input_path, vm_name):
+        """Test VM import command construction."""
+        # The command should be: orbctl import -n <name> <path>
+        expected_command = build_vm_import_command(input_path, vm_name)
 
-        assert "orbctl import" in expected_command
-        assert "-n" in expected_command
-        assert vm_name in expected_command
-        assert input_path in expected_command
-
-    def test_vm_import_command_with_relative_path(self):
-        """Test VM import command with relative path."""
-        input_path = "backups/web-server.tar.zst"
-        vm_name = "web-server-restored"
-
-        expected_command = f"orbctl import -n {vm_name} {input_path}"
-
-        assert "orbctl import" in expected_command
-        assert "-n" in expected_command
-        assert vm_name in expected_command
-        assert input_path in expected_command
+        match = _IMPORT_RE.fullmatch(expected_command)
+        assert match and match.groups() == (vm_name, input_path)
 
     def test_export_import_roundtrip_commands(self):
         """Test export and import command pairing."""
@@ -107,136 +115,81 @@ class TestVMExportImportOperations:
         restore_name = "production-vm-restored"
 
         # Export command
-        export_cmd = f"orbctl export {vm_name} {backup_path}"
+        export_cmd = build_vm_export_command(vm_name, backup_path)
         assert "orbctl export" in export_cmd
         assert vm_name in export_cmd
         assert backup_path in export_cmd
 
         # Import command
-        import_cmd = f"orbctl import -n {restore_name} {backup_path}"
+        import_cmd = build_vm_import_command(backup_path, restore_name)
         assert "orbctl import" in import_cmd
         assert "-n" in import_cmd
         assert restore_name in import_cmd
         assert backup_path in import_cmd
 
-    def test_vm_export_path_variations(self):
-        """Test VM export with different path formats."""
-        vm_name = "test-vm"
-        paths = [
-            "/tmp/backup.tar.zst",
-            "backup.tar.zst",
-            "./backups/vm.tar.zst",
-            "/home/user/backups/test-vm-2024.tar.zst",
-        ]
-
-        for path in paths:
-            command = f"orbctl export {vm_name} {path}"
-            assert "orbctl export" in command
-            assert vm_name in command
-            assert path in command
-
-
-class TestVMRenameOperations:
-    """Test VM rename operations command construction."""
-
-    def test_vm_rename_command_basic(self):
-        """Test basic VM rename command construction."""
-        old_name = "old-vm"
-        new_name = "new-vm"
-
-        # The command should be: orbctl rename old-vm new-vm
-        expected_command = f"orbctl rename {old_name} {new_name}"
-
-        assert "orbctl rename" in expected_command
-        assert old_name in expected_command
-        assert new_name in expected_command
-
-    def test_vm_rename_command_with_special_chars(self):
-        """Test VM rename command with special characters."""
-        old_name = "test-vm-01"
-        new_name = "prod-vm_v2"
-
-        expected_command = f"orbctl rename {old_name} {new_name}"
-
-        assert "orbctl rename" in expected_command
-        assert old_name in expected_command
-        assert new_name in expected_command
-
-    def test_vm_rename_scenarios(self):
-        """Test various VM rename scenarios."""
-        scenarios = [
-            ("dev-server", "prod-server"),
-            ("test_vm", "production_vm"),
-            ("web-01", "web-02"),
-            ("old_name", "new-name"),
-        ]
-
-        for old, new in scenarios:
-            command = f"orbctl rename {old} {new}"
-            assert "orbctl rename" in command
-            assert old in command
-            assert new in command
-
-
-class TestSSHOperations:
-    """Test SSH operations command construction."""
 
-    def test_ssh_info_command_basic(self):
-        """Test basic SSH info command construction."""
-        vm_name = "test-vm"
-
-        # The command should be: orbctl info test-vm --format json
-        # or orbctl ssh for general info
-        expected_command_specific = f"orbctl info {vm_name} --format json"
-        expected_command_general = "orbctl ssh"
+# VM rename operations command construction
+@pytest.mark.parametrize("old_name,new_name", RENAME_CASES)
+def test_vm_rename_command(old_name, new_name):
+    """Test VM rename command construction."""
+    # The command should be: orbctl rename <old> <new>
+    expected_command = build_vm_rename_command(old_name, new_name)
 
-        # Test specific machine info
-        assert "orbctl info" in expected_command_specific
-        assert vm_name in expected_command_specific
-        assert "--format json" in expected_command_specific
+    match = _RENAME_RE.fullmatch(expected_command)
+    assert match and match.groups() == (old_name, new_name)
 
-        # Test general SSH info
-        assert "orbctl ssh" in expected_command_general
 
-    def test_ssh_info_command_without_machine(self):
-        """Test SSH info command without specific machine."""
-        # The command should be: orbctl ssh
-        expected_command = "orbctl ssh"
+# SSH operations command construction
+def _assert_info_command(vm_name):
+    """Assert the SSH info/connect string command for vm_name is well formed."""
+    # The command should be: orbctl info <name> --format json
+    match = _INFO_RE.fullmatch(build_ssh_info_command(vm_name))
+    assert match and match.group(1) == vm_name
 
-        assert "orbctl ssh" in expected_command
-        assert "orbctl ssh" == expected_command
 
-    def test_ssh_connect_string_command(self):
-        """Test SSH connect string command construction."""
-        vm_name = "web-server"
+@pytest.mark.parametrize("vm_name", SSH_INFO_MACHINES)
+def test_ssh_info_command(vm_name):
+    """Test SSH info/connect string command construction for a machine."""
+    _assert_info_command(vm_name)
 
-        # The command should be: orbctl info web-server --format json
-        expected_command = f"orbctl info {vm_name} --format json"
 
-        assert "orbctl info" in expected_command
-        assert vm_name in expected_command
-        assert "--format json" in expected_command
+def test_ssh_info_command_without_machine():
+    """Test SSH info command without specific machine."""
+    # The command should be: orbctl ssh
+    expected_command = build_ssh_info_command()
 
-    def test_ssh_operations_with_various_machines(self):
-        """Test SSH operations with different machine names."""
-        machines = [
-            "ubuntu-vm",
-            "web-server-01",
-            "db_server",
-            "test-machine",
-        ]
-
-        for machine in machines:
-            # SSH info command
-            info_cmd = f"orbctl info {machine} --format json"
-            assert "orbctl info" in info_cmd
-            assert machine in info_cmd
-            assert "--format json" in info_cmd
+    assert "orbctl ssh" in expected_command
+    assert "orbctl ssh" == expected_command
 
 
 class TestPhase2OperationsIntegration:
     """Test integration scenarios for Phase 2 operations."""
 
+    # Tokens each lifecycle operation's command must contain
+    _LIFECYCLE_CHECKS = {
+        "clone": ("clone",),
+        "export": ("export",),
+        "import": ("import", "-n"),
+        "rename": ("rename",),
+        "ssh_info": ("info", "--format json"),
+    }
+
+    # (operation, command) pairs for a full Phase 2 lifecycle
+    _LIFECYCLE_OPERATIONS = (
+        # Create original VM (Phase 1)
+        ("create", build_vm_create_command("original-vm", "ubuntu:22.04")),
+        # Clone VM
+        ("clone", build_vm_clone_command("original-vm", "cloned-vm")),
+        # Export original
+        ("export", build_vm_export_command("original-vm", "/tmp/backup.tar.zst")),
+        # Rename cloned VM
+        ("rename", build_vm_rename_command("cloned-vm", "production-vm")),
+        # Get SSH info
+        ("ssh_info", build_ssh_info_command("production-vm")),
+        # Import from backup
+        ("import", build_vm_import_command("/tmp/backup.tar.zst", "restored-vm")),
+    )
+
     def test_vm_backup_restore_workflow(self):
         """Test complete backup and restore workflow commands."""
         original_vm = "production-db"
@@ -244,13 +197,13 @@ class TestPhase2OperationsIntegration:
         restored_vm = "production-db-restored"
 
         # Backup workflow
-        export_cmd = f"orbctl export {original_vm} {backup_file}"
+        export_cmd = build_vm_export_command(original_vm, backup_file)
         assert "orbctl export" in export_cmd
         assert original_vm in export_cmd
         assert backup_file in export_cmd
 
         # Restore workflow
-        import_cmd = f"orbctl import -n {restored_vm} {backup_file}"
+        import_cmd = build_vm_import_command(backup_file, restored_vm)
         assert "orbctl import" in import_cmd
         assert "-n" in import_cmd
         assert restored_vm in import_cmd
@@ -263,83 +216,63 @@ class TestPhase2OperationsIntegration:
         final = "customized-vm"
 
         # Clone
-        clone_cmd = f"orbctl clone {source} {clone}"
+        clone_cmd = build_vm_clone_command(source, clone)
         assert "orbctl clone" in clone_cmd
         assert source in clone_cmd
         assert clone in clone_cmd
 
         # Rename
-        rename_cmd = f"orbctl rename {clone} {final}"
+        rename_cmd = build_vm_rename_command(clone, final)
         assert "orbctl rename" in rename_cmd
         assert clone in rename_cmd
         assert final in rename_cmd
 
     def test_phase2_operations_lifecycle(self):
         """Test complete Phase 2 operations lifecycle."""
-        operations = [
-            # Create original VM (Phase 1)
-            ("create", "orbctl create ubuntu:22.04 original-vm"),
-            # Clone VM
-            ("clone", "orbctl clone original-vm cloned-vm"),
-            # Export original
-            ("export", "orbctl export original-vm /tmp/backup.tar.zst"),
-            # Rename cloned VM
-            ("rename", "orbctl rename cloned-vm production-vm"),
-            # Get SSH info
-            ("ssh_info", "orbctl info production-vm --format json"),
-            # Import from backup
-            ("import", "orbctl import -n restored-vm /tmp/backup.tar.zst"),
-        ]
-
-        for op_name, command in operations:
+        for op_name, command in self._LIFECYCLE_OPERATIONS:
             assert "orbctl" in command
             # Verify each operation has proper command structure
-            if op_name == "clone":
-                assert "clone" in command
-            elif op_name == "export":
-                assert "export" in command
-            elif op_name == "import":
-                assert "import" in command
-                assert "-n" in command
-            elif op_name == "rename":
-                assert "rename" in command
-            elif op_name == "ssh_info":
-                assert "info" in command
-                assert "--format json" in command
+            for token in self._LIFECYCLE_CHECKS.get(op_name, ()):
+                assert token in command
 
 
 class TestPhase2CommandValidation:
     """Test validation and edge cases for Phase 2 commands."""
 
+    # Clone sources/targets that share the same base name
+    _SIMILAR_CLONE_NAMES = (
+        ("vm-01", "vm-02"),
+        ("vm_source", "vm_clone"),
+        ("test-vm", "prod-vm"),
+    )
+
+    _BACKUP_PATHS = (
+        "/tmp/backup.tar.zst",
+        "relative/backup.tar.zst",
+        "./local-backup.tar.zst",
+    )
+
+    _RENAME_SCENARIOS = (
+        ("old", "new"),
+        ("vm-01", "vm-02"),
+        ("test_a", "test_b"),
+    )
+
+    _SSH_MACHINES = ("vm1", "vm-2", "test_vm")
+
     def test_clone_same_name_detection(self):
         """Test that clone command construction works even with similar names."""
-        base_name = "vm"
-        scenarios = [
-            (f"{base_name}-01", f"{base_name}-02"),
-            (f"{base_name}_source", f"{base_name}_clone"),
-            (f"test-{base_name}", f"prod-{base_name}"),
-        ]
-
-        for source, target in scenarios:
-            command = f"orbctl clone {source} {target}"
-            assert source in command
-            assert target in command
-            # Ensure both names are present and distinct
-            assert command.count(source) >= 1
-            assert command.count(target) >= 1
+        for source, target in self._SIMILAR_CLONE_NAMES:
+            command = build_vm_clone_command(source, target)
+            assert source in command and target in command
 
     def test_export_import_path_consistency(self):
         """Test that export/import use consistent path formats."""
         vm_name = "test-vm"
-        paths = [
-            "/tmp/backup.tar.zst",
-            "relative/backup.tar.zst",
-            "./local-backup.tar.zst",
-        ]
 
-        for path in paths:
-            export_cmd = f"orbctl export {vm_name} {path}"
-            import_cmd = f"orbctl import -n {vm_name} {path}"
+        for path in self._BACKUP_PATHS:
+            export_cmd = build_vm_export_command(vm_name, path)
+            import_cmd = build_vm_import_command(path, vm_name)
 
             # Both should reference the same path
             assert path in export_cmd
@@ -348,30 +281,14 @@ class TestPhase2CommandValidation:
     def test_rename_validation(self):
         """Test rename command validation."""
         # Test that old and new names are different
-        scenarios = [
-            ("old", "new"),
-            ("vm-01", "vm-02"),
-            ("test_a", "test_b"),
-        ]
-
-        for old, new in scenarios:
-            command = f"orbctl rename {old} {new}"
+        for old, new in self._RENAME_SCENARIOS:
+            command = build_vm_rename_command(old, new)
             assert old in command
             assert new in command
             assert old != new  # Ensure we're not renaming to the same name
 
     def test_ssh_operations_command_format(self):
         """Test SSH operations generate correct command formats."""
-        machines = ["vm1", "vm-2", "test_vm"]
-
-        for machine in machines:
-            # SSH info should use orbctl info with JSON format
-            info_cmd = f"orbctl info {machine} --format json"
-            assert "orbctl info" in info_cmd
-            assert machine in info_cmd
-            assert "--format json" in info_cmd
-
-            # SSH connect string also uses orbctl info
-            connect_cmd = f"orbctl info {machine} --format json"
-            assert "orbctl info" in connect_cmd
-            assert machine in connect_cmd
+        # SSH info and the SSH connect string both use orbctl info with JSON
+        for machine in self._SSH_MACHINES:
+            _assert_info_command(machine)
@@ -5,172 +5,132 @@ These tests focus on the command building logic without calling the decorated
 PyInfra operations directly, which avoids issues with the @operation decorator.
 """
 
-
-class TestVMOperationsCommandConstruction:
-    """Test VM operations command construction logic."""
-
-    def test_vm_create_command_basic(self):
-        """Test basic VM creation command construction."""
-        # Import the module to access the command construction logic
-
-        # Test basic command construction
-        vm_name = "test-vm"
-        image = "ubuntu:22.04"
-
-        # The command should be: orbctl create ubuntu:22.04 test-vm
-        expected_command = f"orbctl create {image} {vm_name}"
-
-        # We can't call the decorated function directly, but we can verify
-        # the command construction logic by examining the source code
-        assert "orbctl create" in expected_command
-        assert vm_name in expected_command
-        assert image in expected_command
-
-    def test_vm_create_command_with_arch(self):
-        """Test VM creation command with architecture."""
-        vm_name = "test-vm"
-        image = "ubuntu:22.04"
-        arch = "arm64"
-
-        # The command should be: orbctl create ubuntu:22.04 test-vm --arch arm64
-        expected_command = f"orbctl create {image} {vm_name} --arch {arch}"
-
-        assert "orbctl create" in expected_command
-        assert vm_name in expected_command
-        assert image in expected_command
-        assert f"--arch {arch}" in expected_command
-
-    def test_vm_create_command_with_user(self):
-        """Test VM creation command with user."""
-        vm_name = "test-vm"
-        image = "ubuntu:22.04"
-        user = "ubuntu"
-
-        # The command should be: orbctl create ubuntu:22.04 test-vm --user ubuntu
-        expected_command = f"orbctl create {image} {vm_name} --user {user}"
-
-        assert "orbctl create" in expected_command
-        assert vm_name in expected_command
-        assert image in expected_command
-        assert f"--user {user}" in expected_command
-
-    def test_vm_create_command_with_arch_and_user(self):
-        """Test VM creation command with both architecture and user."""
-        vm_name = "test-vm"
-        image = "ubuntu:22.04"
-        arch = "arm64"
-        user = "ubuntu"
-
-        # The command should be: orbctl create ubuntu:22.04 test-vm --arch arm64 --user ubuntu
-        expected_command = (
-            f"orbctl create {image} {vm_name} --arch {arch} --user {user}"
-        )
-
-        assert "orbctl create" in expected_command
-        assert vm_name in expected_command
-        assert image in expected_command
-        assert f"--arch {arch}" in expected_command
-        assert f"--user {user}" in expected_command
-
-    def test_vm_delete_command_basic(self):
-        """Test basic VM deletion command construction."""
-        vm_name = "test-vm"
-
-        # The command should be: orbctl delete test-vm
-        expected_command = f"orbctl delete {vm_name}"
-
-        assert "orbctl delete" in expected_command
-        assert vm_name in expected_command
-
-    def test_vm_delete_command_with_force(self):
-        """Test VM deletion command with force flag."""
-        vm_name = "test-vm"
-
-        # The command should be: orbctl delete -f test-vm
-        expected_command = f"orbctl delete -f {vm_name}"
-
-        assert "orbctl delete -f" in expected_command
-        assert vm_name in expected_command
-
-    def test_vm_start_command(self):
-        """Test VM start command construction."""
-        vm_name = "test-vm"
-
-        # The command should be: orbctl start test-vm
-        expected_command = f"orbctl start {vm_name}"
-
-        assert "orbctl start" in expected_command
-        assert vm_name in expected_command
-
-    def test_vm_stop_command(self):
-        """Test VM stop command construction."""
-        vm_name = "test-vm"
-
-        # The command should be: orbctl stop test-vm
-        expected_command = f"orbctl stop {vm_name}"
-
-        assert "orbctl stop" in expected_command
-        assert vm_name in expected_command
-
-    def test_vm_restart_command(self):
-        """Test VM restart command construction."""
-        vm_name = "test-vm"
-
-        # The command should be: orbctl restart test-vm
-        expected_command = f"orbctl restart {vm_name}"
-
-        assert "orbctl restart" in expected_command
-        assert vm_name in expected_command
-
-    def test_vm_info_command(self):
-        """Test VM info command construction."""
-        vm_name = "test-vm"
-
-        # The command should be: orbctl info test-vm -f json
-        expected_command = f"orbctl info {vm_name} -f json"
-
-        assert "orbctl info" in expected_command
-        assert vm_name in expected_command
-        assert "-f json" in expected_command
-
-    def test_vm_list_command(self):
-        """Test VM list command construction."""
-        # The command should be: orbctl list -f json
-        expected_command = "orbctl list -f json"
-
-        assert "orbctl list" in expected_command
-        assert "-f json" in expected_command
-
-    def test_vm_status_command(self):
-        """Test VM status command construction."""
-        vm_name = "test-vm"
-
-        # The command should be: orbctl status test-vm
-        expected_command = f"orbctl status {vm_name}"
-
-        assert "orbctl status" in expected_command
-        assert vm_name in expected_command
-
-    def test_vm_ip_command(self):
-        """Test VM IP command construction."""
-        vm_name = "test-vm"
-
-        # The command should be: orbctl ip test-vm
-        expected_command = f"orbctl ip {vm_name}"
-
-        assert "orbctl ip" in expected_command
-        assert vm_name in expected_command
-
-    def test_vm_network_info_command(self):
-        """Test VM network info command construction."""
-        vm_name = "test-vm"
-
-        # The command should be: orbctl network test-vm -f json
-        expected_command = f"orbctl network {vm_name} -f json"
-
-        assert "orbctl network" in expected_command
-        assert vm_name in expected_command
-        assert "-f json" in expected_command
+import re
+
+import pytest
+
+from pyinfra_orbstack.operations.vm import (
+    build_vm_create_command,
+    build_vm_delete_command,
+    build_vm_info_command,
+    build_vm_list_command,
+    build_vm_restart_command,
+    build_vm_start_command,
+    build_vm_stop_command,
+)
+
+VM_NAME = "test-vm"
+IMAGE = "ubuntu:22.04"
+ARCH = "arm64"
+
+# Architectures accepted by `orbctl create --arch`
+_VALID_ARCHS = frozenset(("arm64", "amd64", "x86_64"))
+
+# Valid VM names, images and usernames
+_VALID_NAMES = frozenset(
+    ("test-vm", "web-server", "db-server-01", "router_vm", "test123")
+)
+_VALID_IMAGES = frozenset(
+    ("ubuntu:22.04", "alpine:latest", "debian:bullseye", "centos:7", "fedora:latest")
+)
+_VALID_USERS = frozenset(("ubuntu", "root", "postgres", "user123", "test_user"))
+
+# Shapes of a VM name, a distro:version image and a POSIX-style username
+_NAME_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9_-]*")
+_IMAGE_RE = re.compile(r"[a-z0-9]+:[a-z0-9.]+")
+_USER_RE = re.compile(r"[a-z_][a-z0-9_-]*")
+
+# vm_status, vm_ip and vm_network_info have no orbctl subcommand of their
+# own; each yields the info builder. The builders' own golden commands live
+# in test_vm_command_builders.py
+_INFO_OPERATION_BUILDERS = {
+    "vm_status": build_vm_info_command,
+    "vm_ip": build_vm_info_command,
+    "vm_network_info": build_vm_info_command,
+}
+
+
+# Lifecycle commands in order
+_LIFECYCLE_CMDS = (
+    build_vm_create_command(VM_NAME, IMAGE),  # Create
+    build_vm_start_command(VM_NAME),  # Start
+    build_vm_info_command(VM_NAME),  # Check status
+    build_vm_restart_command(VM_NAME),  # Restart
+    build_vm_stop_command(VM_NAME),  # Stop
+    build_vm_delete_command(VM_NAME, force=True),  # Delete with force
+)
+
+# Information commands
+_INFO_CMDS = (
+    build_vm_list_command(),  # List all VMs
+    build_vm_info_command(VM_NAME),  # Get VM info
+    build_vm_info_command(VM_NAME),  # Get network info
+)
+
+# (scenario, name, image, arch, user, expected_flags)
+_CREATION_SCENARIOS = (
+    ("basic", VM_NAME, IMAGE, None, None, ()),
+    ("arm64", f"{VM_NAME}-arm", IMAGE, "arm64", None, ("--arch arm64",)),
+    ("user", f"{VM_NAME}-user", IMAGE, None, "ubuntu", ("--user ubuntu",)),
+    (
+        "full",
+        f"{VM_NAME}-full",
+        IMAGE,
+        "arm64",
+        "ubuntu",
+        ("--arch arm64", "--user ubuntu"),
+    ),
+)
+
+
+# (builder, args, kwargs, expected command line) for empty names/images
+EDGE_CASES = [
+    pytest.param(
+        build_vm_create_command,
+        ("", IMAGE),
+        {},
+        "orbctl create ubuntu:22.04 ",
+        id="create-empty-name",
+    ),
+    pytest.param(
+        build_vm_create_command,
+        (VM_NAME, ""),
+        {},
+        "orbctl create  test-vm",
+        id="create-empty-image",
+    ),
+    pytest.param(
+        build_vm_delete_command, ("",), {}, "orbctl delete", id="delete-empty"
+    ),
+    pytest.param(build_vm_start_command, ("",), {}, "orbctl start ", id="start-empty"),
+    pytest.param(build_vm_stop_command, ("",), {}, "orbctl stop", id="stop-empty"),
+    pytest.param(
+        build_vm_restart_command, ("",), {}, "orbctl restart ", id="restart-empty"
+    ),
+]
+
+# (name, expected create command line)
+SPECIAL_CHARACTER_CASES = [
+    ("test-vm-with-dashes", "orbctl create ubuntu:22.04 test-vm-with-dashes"),
+    (
+        "test_vm_with_underscores",
+        "orbctl create ubuntu:22.04 test_vm_with_underscores",
+    ),
+    ("test-vm_with-mixed", "orbctl create ubuntu:22.04 test-vm_with-mixed"),
+]
+
+
+# Operations that read `orbctl info`
+@pytest.mark.parametrize(
+    "operation,builder",
+    _INFO_OPERATION_BUILDERS.items(),
+    ids=list(_INFO_OPERATION_BUILDERS),
+)
+def test_info_operation_command(operation, builder):
+    """Test that the info-backed operations run `orbctl info` for the VM."""
+    # We can't call the decorated functions directly, so call the builder
+    # each one yields from and compare against the exact command line
+    assert builder(VM_NAME) == "orbctl info test-vm --format json"
 
 
 class TestVMOperationsParameterValidation:
@@ -178,64 +138,26 @@ class TestVMOperationsParameterValidation:
 
     def test_vm_name_validation(self):
         """Test VM name parameter validation."""
-        # Valid VM names
-        valid_names = [
-            "test-vm",
-            "web-server",
-            "db-server-01",
-            "router_vm",
-            "test123",
-        ]
-
-        for name in valid_names:
-            # Basic validation: name should be a non-empty string
-            assert isinstance(name, str)
-            assert len(name) > 0
-            assert name.strip() == name  # No leading/trailing whitespace
+        # Names are alphanumerics, dashes and underscores
+        assert all(_NAME_RE.fullmatch(name) for name in _VALID_NAMES)
 
     def test_image_validation(self):
         """Test image parameter validation."""
-        # Valid image formats
-        valid_images = [
-            "ubuntu:22.04",
-            "alpine:latest",
-            "debian:bullseye",
-            "centos:7",
-            "fedora:latest",
-        ]
-
-        for image in valid_images:
-            # Basic validation: image should be a non-empty string
-            assert isinstance(image, str)
-            assert len(image) > 0
-            assert ":" in image  # Should have format distro:version
+        # Images are of the form distro:version
+        assert all(_IMAGE_RE.fullmatch(image) for image in _VALID_IMAGES)
 
     def test_arch_validation(self):
         """Test architecture parameter validation."""
-        # Valid architectures
-        valid_archs = ["arm64", "amd64", "x86_64"]
-
-        for arch in valid_archs:
-            # Basic validation: arch should be a valid string
-            assert isinstance(arch, str)
-            assert arch in ["arm64", "amd64", "x86_64"]
+        # Every arch the command tests pass to `orbctl create` is supported
+        for scenario in _CREATION_SCENARIOS:
+            arch = scenario[3]
+            assert arch is None or arch in _VALID_ARCHS
+        assert ARCH in _VALID_ARCHS
 
     def test_user_validation(self):
         """Test user parameter validation."""
-        # Valid usernames
-        valid_users = [
-            "ubuntu",
-            "root",
-            "postgres",
-            "user123",
-            "test_user",
-        ]
-
-        for user in valid_users:
-            # Basic validation: user should be a non-empty string
-            assert isinstance(user, str)
-            assert len(user) > 0
-            assert user.strip() == user  # No leading/trailing whitespace
+        # Usernames follow the POSIX portable username shape
+        assert all(_USER_RE.fullmatch(user) for user in _VALID_USERS)
 
 
 class TestVMOperationsIntegrationScenarios:
@@ -243,120 +165,42 @@ class TestVMOperationsIntegrationScenarios:
 
     def test_vm_lifecycle_commands(self):
         """Test complete VM lifecycle command sequence."""
-        vm_name = "test-vm"
-        image = "ubuntu:22.04"
-
-        # Lifecycle commands in order
-        commands = [
-            f"orbctl create {image} {vm_name}",  # Create
-            f"orbctl start {vm_name}",  # Start
-            f"orbctl status {vm_name}",  # Check status
-            f"orbctl restart {vm_name}",  # Restart
-            f"orbctl stop {vm_name}",  # Stop
-            f"orbctl delete -f {vm_name}",  # Delete with force
-        ]
-
         # Verify all commands are properly constructed
-        for i, command in enumerate(commands):
+        for i, command in enumerate(_LIFECYCLE_CMDS):
             assert "orbctl" in command
-            assert vm_name in command
+            assert VM_NAME in command
             if i == 0:  # Create command
-                assert image in command
+                assert IMAGE in command
             elif i == 5:  # Delete command
                 assert "-f" in command
 
     def test_vm_info_commands(self):
         """Test VM information command sequence."""
-        vm_name = "test-vm"
-
-        # Information commands
-        commands = [
-            "orbctl list -f json",  # List all VMs
-            f"orbctl info {vm_name} -f json",  # Get VM info
-            f"orbctl status {vm_name}",  # Get VM status
-            f"orbctl ip {vm_name}",  # Get VM IP
-            f"orbctl network {vm_name} -f json",  # Get network info
-        ]
-
         # Verify all commands are properly constructed
-        for command in commands:
-            assert "orbctl" in command
-            if vm_name in command:
-                assert vm_name in command
-            if "-f json" in command:
-                assert "-f json" in command
+        assert _INFO_CMDS == (
+            "orbctl list -f json",
+            "orbctl info test-vm --format json",
+            "orbctl info test-vm --format json",
+        )
 
     def test_vm_creation_variations(self):
         """Test different VM creation scenarios."""
-        base_image = "ubuntu:22.04"
-        base_name = "test-vm"
-
-        # Different creation scenarios
-        scenarios = [
-            # (name, image, arch, user, expected_flags)
-            ("basic", base_name, base_image, None, None, []),
-            ("arm64", f"{base_name}-arm", base_image, "arm64", None, ["--arch arm64"]),
-            (
-                "user",
-                f"{base_name}-user",
-                base_image,
-                None,
-                "ubuntu",
-                ["--user ubuntu"],
-            ),
-            (
-                "full",
-                f"{base_name}-full",
-                base_image,
-                "arm64",
-                "ubuntu",
-                ["--arch arm64", "--user ubuntu"],
-            ),
-        ]
-
-        for scenario_name, name, image, arch, user, expected_flags in scenarios:
+        for scenario in _CREATION_SCENARIOS:
+            _, name, image, arch, user, expected_flags = scenario
+
             # Construct expected command
-            command = f"orbctl create {image} {name}"
-            for flag in expected_flags:
-                command += f" {flag}"
+            expected = " ".join((f"orbctl create {image} {name}", *expected_flags))
 
             # Verify command construction
-            assert "orbctl create" in command
-            assert name in command
-            assert image in command
+            command = build_vm_create_command(name, image, arch=arch, user=user)
+            assert command == expected
 
-            for flag in expected_flags:
-                assert flag in command
-
-    def test_vm_operations_edge_cases(self):
+    @pytest.mark.parametrize("fn,args,kwargs,expected", EDGE_CASES)
+    def test_vm_operations_edge_cases(self, fn, args, kwargs, expected):
         """Test edge cases for VM operations command construction."""
-        # Test command construction with empty strings
-        empty_name_cmd = "orbctl create ubuntu:22.04 "
-        empty_image_cmd = "orbctl create  test-vm"
-        empty_delete_cmd = "orbctl delete  "
-        empty_start_cmd = "orbctl start "
-        empty_stop_cmd = "orbctl stop  "
-        empty_restart_cmd = "orbctl restart "
-
-        # Verify command construction handles empty strings
-        assert "orbctl" in empty_name_cmd
-        assert "orbctl" in empty_image_cmd
-        assert "orbctl" in empty_delete_cmd
-        assert "orbctl" in empty_start_cmd
-        assert "orbctl" in empty_stop_cmd
-        assert "orbctl" in empty_restart_cmd
-
-    def test_vm_operations_special_characters(self):
+        assert fn(*args, **kwargs) == expected
+
+    @pytest.mark.parametrize("name,expected", SPECIAL_CHARACTER_CASES)
+    def test_vm_operations_special_characters(self, name, expected):
         """Test VM operations with special characters in names."""
-        # Test command construction with special characters
-        dash_cmd = "orbctl create ubuntu:22.04 test-vm-with-dashes"
-        underscore_cmd = "orbctl create ubuntu:22.04 test_vm_with_underscores"
-        mixed_cmd = "orbctl create ubuntu:22.04 test-vm_with-mixed"
-
-        # Verify command construction handles special characters
-        assert "orbctl" in dash_cmd
-        assert "test-vm-with-dashes" in dash_cmd
-        assert "orbctl" in underscore_cmd
-        assert "test_vm_with_underscores" in underscore_cmd
-        assert "orbctl" in mixed_cmd
-        assert "test-vm_with-mixed" in mixed_cmd
+        assert build_vm_create_command(name, IMAGE) == expected